@@ -1,10 +1,26 @@
--- PostgreSQL
+-- PostgreSQL 11 or later
 CREATE TABLE IF NOT EXISTS obs (
     station text, 
     direction numeric, 
     speed_kts numeric, 
     gust_kts numeric, 
-    update_time timestamp, 
-    CONSTRAINT obs_idx UNIQUE (station, update_time)
+    update_time timestamp
 );
 
+-- One observation per station and update time. The index also serves the
+-- web app's "station = ? AND update_time in range ORDER BY update_time"
+-- query: carrying the observation columns lets Postgres answer it with an
+-- index-only scan, already in order, without visiting the table.
+CREATE UNIQUE INDEX IF NOT EXISTS obs_station_time_key
+    ON obs (station, update_time) INCLUDE (direction, speed_kts, gust_kts);
+
+-- Older databases have the same key in the obs_idx constraint and in a
+-- separate covering index; the index above replaces both, so each insert
+-- only updates one btree.
+ALTER TABLE obs DROP CONSTRAINT IF EXISTS obs_idx;
+DROP INDEX IF EXISTS obs_station_time_idx;
+
+-- obs_recent, a materialized view of the last few hours, used to sit in
+-- front of the index above. It needed a refresh after every write and
+-- could fall behind obs, while the index-only scan is already fast enough.
+DROP MATERIALIZED VIEW IF EXISTS obs_recent;
@@ -1,19 +1,15 @@
-#!/usr/bin/python
+#!/usr/bin/env python3
 
 import os
 import sys
-try:
-    from bs4 import BeautifulSoup
-except ImportError, ie:
-    sys.path.append(os.path.join(os.getcwd(), 'site-packages'))
-    from bs4 import BeautifulSoup
-import urllib2
+from bs4 import BeautifulSoup
+import urllib.request
 import re
 import time
 from datetime import datetime
 import psycopg2
 import json
-import urlparse
+from urllib.parse import urlparse
 
 url_base = "http://atm.navcanada.ca/atm/iwv/"
 station_default = 'CYTZ'
@@ -27,16 +23,18 @@ wind_speed_re = re.compile('Wind Speed:')
 wind_gust_re = re.compile('Gusting:')
 updated_re = re.compile('Updated:')
 error_time_fmt = '%m-%d %H:%M:%S'
+# schema.sql uses covering (INCLUDE) indexes
+min_server_version = 110000
 
 value_lookup = { '':None, 'CALM':0, '?':None, '--':None }
-coerce_int = lambda x: value_lookup[x] if value_lookup.has_key(x) else int(x)
+coerce_int = lambda x: value_lookup[x] if x in value_lookup else int(x)
 
 def scrapeIIDSWebView(url):
     "Returns the wind data as tuple (direction, speed, gust, datetime)"
-    response = urllib2.urlopen(url, None, socket_timeout)
+    response = urllib.request.urlopen(url, None, socket_timeout)
     html = response.read()
     response.close()
-    soup = BeautifulSoup(html)
+    soup = BeautifulSoup(html, 'html.parser')
     wind_dir = None
     wind_dir_text = None
     wind_speed = None
@@ -49,28 +47,28 @@ def scrapeIIDSWebView(url):
     try:
         wind_dir_text = find_iids_text(wind_dir_re)
         wind_dir = coerce_int(wind_dir_text)
-    except ValueError, ex:
+    except ValueError as ex:
         sys.stderr.write('ValueError %s: wind_dir_text="%s"\n' % (str(ex), wind_dir_text))
     
     # Wind speed
     try:
         wind_speed_text = find_iids_text(wind_speed_re)
         wind_speed = coerce_int(wind_speed_text)
-    except ValueError, ex:
+    except ValueError as ex:
         sys.stderr.write('ValueError %s: wind_speed_text="%s"\n' % (str(ex), wind_speed_text))
 
     # Wind gust
     try:
         wind_gust_text = find_iids_text(wind_gust_re)
         wind_gust = coerce_int(wind_gust_text.strip('G'))
-    except ValueError, ex:
+    except ValueError as ex:
         sys.stderr.write('ValueError %s: wind_gust_text="%s"\n' % (str(ex), wind_gust_text))
     
     # Update date/time
     try:
         updated_text = find_iids_text(updated_re)
         updated = datetime.strptime(updated_text, '%Y-%m-%d %H:%M:%SZ')
-    except ValueError, ex:
+    except ValueError as ex:
         sys.stderr.write('ValueError %s: updated_text="%s"\n' % (str(ex), updated_text))
         updated = None
 
@@ -90,7 +88,7 @@ def run(conn, station, refresh_rate=60):
     while True:
         try:
             obs = scrapeIIDSWebView(url_base + station)
-        except Exception, ex:
+        except Exception as ex:
             sys.stderr.write('%s %s in scrapeIIDSWebView(%s): %s\n' %
                 (datetime.now().strftime(error_time_fmt), type(ex).__name__, 
                 url_base+station, str(ex)))
@@ -101,7 +99,7 @@ def run(conn, station, refresh_rate=60):
                 if obs[0] is not None or obs[1] is not None:
                     try:
                         writeObservation(c, (station,) + obs)
-                    except Exception, ex:
+                    except Exception as ex:
                         sys.stderr.write('%s %s in writeObservation: %s\n' % 
                             (datetime.now().strftime(error_time_fmt), 
                             type(ex).__name__, str(ex)) )
@@ -115,7 +113,7 @@ def run(conn, station, refresh_rate=60):
                     finally:
                         time.sleep(refresh_rate)
                 else:
-                    print 'Skipping observation %s' % str(obs)
+                    print('Skipping observation %s' % str(obs))
                     time.sleep(refresh_rate / 2)
             else:
                 # sleep half the refresh time when we get a duplicate
@@ -130,9 +128,9 @@ def getdb():
     if services:
         try:
             creds = services['postgresql-9.1'][0]['credentials']
-        except KeyError, ke:
-            print >> sys.stderr, "VCAP_SERVICES = %s" % str(services)
-            raise ke
+        except KeyError:
+            sys.stderr.write("VCAP_SERVICES = %s\n" % str(services))
+            raise
         database = creds['name']
         username = creds['username']
         password = creds['password']
@@ -147,16 +145,15 @@ def getdb():
             creds['name'])
     else:
 # Try heroku / localhost
-        urlparse.uses_netloc.append("postgres")
         uri = os.environ.get("DATABASE_URL", default_db)
-        url = urlparse.urlparse(uri)
+        url = urlparse(uri)
         database = url.path[1:]
         username = url.username
         password = url.password
         hostname = url.hostname
         port     = url.port
 
-    print >> sys.stderr, "Connecting to database: %s" % uri
+    sys.stderr.write("Connecting to database: %s\n" % uri)
 
     return psycopg2.connect(
         database=database,
@@ -168,6 +165,10 @@ def getdb():
 
 def init_db(db):
     "Initialize the database"
+    if db.server_version < min_server_version:
+        sys.stderr.write("PostgreSQL 11 or later is required, server is version %d\n" %
+            db.server_version)
+        raise RuntimeError("PostgreSQL %d is too old for schema.sql" % db.server_version)
     with open('schema.sql') as f:
         db.cursor().execute(f.read())
     db.commit()
@@ -1 +0,0 @@
-"The beautifulsoup tests."
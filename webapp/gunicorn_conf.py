@@ -0,0 +1,21 @@
+# gunicorn settings for the web app, used by the Procfile
+import os
+
+bind = '0.0.0.0:%s' % os.environ.get('PORT', 5000)
+# Each worker holds its own pool of up to DB_POOL_MAXCONN (default 5)
+# database connections, so keep the worker count modest and get the
+# concurrency from gevent instead. WEB_CONCURRENCY * DB_POOL_MAXCONN, plus
+# one connection for the scraper, must stay within the database's
+# connection limit (20 on the smaller Heroku Postgres plans): the defaults
+# use 3 * 5 + 1 = 16. Requests queue for a free connection for up to
+# DB_POOL_TIMEOUT seconds (default 10) and then get a 503.
+workers = int(os.environ.get('WEB_CONCURRENCY', 3))
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+
+def post_worker_init(worker):
+    # the gevent worker has patched the standard library by now; make
+    # psycopg2 wait on the database socket through gevent too, so a slow
+    # query only blocks its own greenlet rather than the whole worker
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -1,128 +1,387 @@
 import os
 import sys
-from flask import Flask, jsonify, render_template, request, g
-from datetime import datetime, timedelta
+from flask import Flask, render_template, request, g, stream_with_context, abort
+from datetime import datetime, timedelta, timezone
 import time
-import psycopg2
+import threading
+import weakref
+import re
+import bisect
+import hashlib
+from psycopg2.pool import ThreadedConnectionPool
 import json
+import orjson
+from urllib.parse import urlparse
 
 application = app = Flask(__name__)
+# Let browsers and any proxy/CDN in front of us keep static files for a
+# week so repeat page loads don't reach the app server for them
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(
+    os.environ.get('STATIC_MAX_AGE', 3600*24*7))
 
-services = json.loads(os.environ.get("VCAP_SERVICES", "{}"))
-if not services:
-    import urlparse
-    urlparse.uses_netloc.append("postgres")
-    database_uri = os.environ.get('DATABASE_URL', 'postgres://localhost') 
-    database_url = urlparse.urlparse(database_uri)
-
-current_template = 'current.html'
-day_template = 'day.html'
-default_station = 'CYTZ'
-wind_url = '/wind'
-iso_format = '%Y-%m-%dT%H:%M:%S.%fZ'
+static_versions = {}
 
-epoch = datetime.utcfromtimestamp(0)
-def epoch_time(dt):
-    delta = dt - epoch
-    return delta.total_seconds()
+@app.url_defaults
+def static_version(endpoint, values):
+    """Adds a hash of the file's contents to static URLs, so a deploy that
+    changes a file changes its URL and nobody keeps the old copy"""
+    if endpoint == 'static' and 'filename' in values:
+        filename = values['filename']
+        version = static_versions.get(filename)
+        if version is None:
+            path = os.path.join(app.static_folder, filename)
+            try:
+                with open(path, 'rb') as f:
+                    version = hashlib.md5(f.read()).hexdigest()[:8]
+            except IOError:
+                return
+            static_versions[filename] = version
+        values['v'] = version
 
-def connect_db():
-    if services:
+# Database connection parameters, worked out once from the environment
+services = json.loads(os.environ.get("VCAP_SERVICES", "{}"))
+if services:
 # Try appfog
-        try:
-            creds = services['postgresql-9.1'][0]['credentials']
-        except KeyError, ke:
-            print >> sys.stderr, "VCAP_SERVICES = %s" % str(services)
-            raise ke
-        database = creds['name']
-        username = creds['username']
-        password = creds['password']
-        hostname = creds['hostname']
-        port     = creds['port']
-
-        uri = "postgres://%s:%s@%s:%d/%s" % (
-            creds['username'],
-            creds['password'],
-            creds['hostname'],
-            creds['port'],
-            creds['name'])
-    else:
+    try:
+        creds = services['postgresql-9.1'][0]['credentials']
+    except KeyError:
+        sys.stderr.write("VCAP_SERVICES = %s\n" % str(services))
+        raise
+    db_kw = dict(
+        database=creds['name'],
+        user=creds['username'],
+        password=creds['password'],
+        host=creds['hostname'],
+        port=creds['port'])
+else:
 # Try heroku / localhost
-        uri = database_uri
-        database = database_url.path[1:]
-        username = database_url.username
-        password = database_url.password
-        hostname = database_url.hostname
-        port     = database_url.port
+    database_url = urlparse(os.environ.get('DATABASE_URL', 'postgres://localhost'))
+    db_kw = dict(
+        database=database_url.path[1:],
+        user=database_url.username,
+        password=database_url.password,
+        host=database_url.hostname,
+        port=database_url.port)
+
+# Load and compile the two page templates once, up front. render_template
+# takes the Template objects as they are, so requests skip the loader
+# entirely, and with auto reload off Jinja never stats the files again.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+current_template = app.jinja_env.get_template('current.html')
+day_template = app.jinja_env.get_template('day.html')
+default_station = 'CYTZ'
+wind_url = '/wind'
+max_bucket_minutes = 60
+wind_batch_rows = 1000
+max_wind_rows = 100000
+max_wind_span = timedelta(7)
+station_re = re.compile(r'[A-Z0-9]{3,5}')
+db_pool_minconn = int(os.environ.get('DB_POOL_MINCONN', 1))
+# per worker process; see gunicorn_conf.py for the total across workers
+db_pool_maxconn = int(os.environ.get('DB_POOL_MAXCONN', 5))
+# seconds a request waits for a free connection before giving up with a 503
+db_pool_timeout = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+# seconds to keep short /wind ranges cached; 0 turns the cache off
+wind_cache_ttl = int(os.environ.get('WIND_CACHE_TTL', 30))
+wind_cache_size = 256
+wind_cache_max_span = timedelta(1)
+wind_max_age = 5
+page_max_age = 60
+past_day_max_age = 300
+page_cache_size = 64
 
-    print >> sys.stderr, "Connecting to database: %s" % uri
+def utc_now():
+    "Returns the current UTC time as a naive datetime, like the obs table's"
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
+def connect_db_pool():
+    "Returns a pool of database connections shared by all requests"
+    sys.stderr.write("Connecting to database %s on %s:%s as %s\n" % (
+        db_kw['database'], db_kw['host'], db_kw['port'], db_kw['user']))
     try: 
-        conn = psycopg2.connect(
-            database=database,
-            user=username,
-            password=password,
-            host=hostname,
-            port=port)
-    except Exception, ex:
-        print >> sys.stderr, "%s: %s" % (type(ex).__name__, str(ex)) 
-        raise ex
+        pool = ThreadedConnectionPool(db_pool_minconn, db_pool_maxconn, **db_kw)
+    except Exception as ex:
+        sys.stderr.write("%s: %s\n" % (type(ex).__name__, str(ex)))
+        raise
     else:
-        return conn
+        return pool
+
+db_pool = None
+db_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises rather than waits once every connection is
+# out, so requests take a slot here first and queue for one instead
+db_pool_slots = threading.BoundedSemaphore(db_pool_maxconn)
+
+def get_db_pool():
+    "Returns the connection pool, creating it on first use"
+    global db_pool
+    if db_pool is None:
+        with db_pool_lock:
+            if db_pool is None:
+                db_pool = connect_db_pool()
+    return db_pool
 
 
 def get_connection():
     db = getattr(g, '_db', None)
     if db is None:
-        db = g._db = connect_db()
+        pool = get_db_pool()
+        if not db_pool_slots.acquire(timeout=db_pool_timeout):
+            abort(503)
+        try:
+            db = g._db = pool.getconn()
+        except Exception:
+            db_pool_slots.release()
+            raise
     return db
 
 @app.teardown_request
 def teardown_request(exception):
-    if hasattr(g, '_db'):
-        g._db.close()
+    db = g.pop('_db', None)
+    if db is None:
+        return
+    # end the request's transaction so the next request gets a clean session,
+    # then hand the connection back to the pool rather than closing it
+    try:
+        if exception is None:
+            db.commit()
+        else:
+            db.rollback()
+    finally:
+        get_db_pool().putconn(db)
+        db_pool_slots.release()
+
+# The /wind queries, with psycopg2 placeholders. Rows come back ready to
+# serialize: the timestamp as whole epoch seconds and the NUMERIC columns as
+# ints, converted by Postgres rather than row by row in Python.
+wind_sql = "SELECT extract(epoch FROM update_time)::bigint, " \
+           "direction::int, speed_kts::int, gust_kts::int " \
+           "FROM obs WHERE station = %s AND update_time >= %s AND update_time < %s " \
+           "ORDER BY update_time LIMIT %s"
+wind_bucket_sql = "SELECT extract(epoch FROM date_trunc('hour', update_time) + " \
+           "floor(extract(minute FROM update_time) / %s) * %s * interval '1 minute')::bigint AS t, " \
+           "round(degrees(atan2(avg(sin(radians(direction))), " \
+           "avg(cos(radians(direction))))) + 360)::int %% 360, " \
+           "round(avg(speed_kts))::int, max(gust_kts)::int " \
+           "FROM obs WHERE station = %s AND update_time >= %s AND update_time < %s " \
+           "GROUP BY t ORDER BY t LIMIT %s"
+wind_statements = {'wind_q': wind_sql, 'wind_bucket_q': wind_bucket_sql}
+
+# the wind_statements each pooled connection has already prepared
+prepared_statements = weakref.WeakKeyDictionary()
+
+def wind_query(station, start_time, end_time, bucket):
+    "Returns the wind_statements name and parameters for a /wind query"
+    if bucket:
+        return 'wind_bucket_q', \
+            (bucket, bucket, station, start_time, end_time, max_wind_rows)
+    else:
+        return 'wind_q', (station, start_time, end_time, max_wind_rows)
+
+def positional_sql(sql):
+    "Rewrites psycopg2 %s placeholders as the $1, $2... PREPARE expects"
+    n = [0]
+    def placeholder(m):
+        if m.group(0) == '%%':
+            return '%'
+        n[0] += 1
+        return '$%d' % n[0]
+    return re.sub(r'%[s%]', placeholder, sql)
 
-def query_wind_data(station, start_time, end_time):
-    "Returns a generator of wind data tuples"
+def query_wind_data(station, start_time, end_time, bucket=0):
+    """Returns an iterator over lists of wind data tuples, read in batches
+    from a server-side cursor so a long time range is never held in memory
+    all at once. If bucket is non-zero the observations are aggregated into
+    bucket-minute intervals by the database: mean direction (circular), mean
+    speed and peak gust. The query runs and the first batch is read before
+    this returns, so a database error is raised here rather than halfway
+    through a streamed response."""
     db = get_connection()
+    name, params = wind_query(station, start_time, end_time, bucket)
+    c = db.cursor('wind_data')
+    try:
+        c.execute(wind_statements[name], params)
+        rows = c.fetchmany(wind_batch_rows)
+    except Exception:
+        c.close()
+        raise
+    return wind_batches(c, rows)
+
+def wind_batches(c, rows):
+    "Yields rows, then the remaining batches from cursor c, and closes it"
+    try:
+        while rows:
+            yield rows
+            rows = c.fetchmany(wind_batch_rows)
+    finally:
+        c.close()
+
+def execute_wind_statement(db, name, params):
+    "Runs one of wind_statements on db, preparing it first if need be"
     c = db.cursor()
-    c.execute("SELECT update_time, direction, speed_kts, gust_kts " \
-              "FROM obs WHERE station = %s AND update_time > %s AND update_time < %s " \
-              "ORDER BY update_time;",
-              (station, start_time, end_time))
-    row = c.fetchone()
-    while row is not None:
-        yield row
-        row = c.fetchone()
-
-def safe_int(d):
     try:
-        i = int(d)
-    except TypeError:
-        i = None
-    return i
+        # Prepare each statement the first time this connection needs it,
+        # and only record it once PREPARE has succeeded. Prepared statements
+        # outlive a rollback, so they must never be prepared twice.
+        prepared = prepared_statements.setdefault(db, set())
+        if name not in prepared:
+            c.execute("PREPARE %s AS %s" % (name, positional_sql(wind_statements[name])))
+            prepared.add(name)
+        c.execute("EXECUTE %s (%s)" % (name, ', '.join(['%s'] * len(params))),
+                  params)
+        return c.fetchall()
+    finally:
+        c.close()
+
+def fetch_wind_data(station, start_time, end_time, bucket=0):
+    """Returns the same rows as query_wind_data as a single list, for short
+    ranges. These are the frequent requests, so they run as prepared
+    statements, planned once per pooled connection rather than per request.
+    (A server-side cursor can't be declared over EXECUTE.)"""
+    db = get_connection()
+    name, params = wind_query(station, start_time, end_time, bucket)
+    return execute_wind_statement(db, name, params)
+
+wind_cache = {}
+wind_cache_lock = threading.Lock()
+
+def get_cached_wind_data(key):
+    "Returns the cached /wind rows for key, or None"
+    with wind_cache_lock:
+        entry = wind_cache.get(key)
+        if entry is None:
+            return None
+        expires, rows = entry
+        if expires < time.time():
+            del wind_cache[key]
+            return None
+        return rows
+
+def set_cached_wind_data(key, rows):
+    with wind_cache_lock:
+        if key not in wind_cache and len(wind_cache) >= wind_cache_size:
+            # drop the oldest entry; dicts keep insertion order
+            del wind_cache[next(iter(wind_cache))]
+        wind_cache[key] = (time.time() + wind_cache_ttl, rows)
+
+epoch = datetime(1970, 1, 1)
+
+def quantize_time(dt):
+    "Rounds dt down to a multiple of wind_cache_ttl seconds"
+    return dt - (dt - datetime.min) % timedelta(seconds=wind_cache_ttl)
+
+def generate_wind_json(station, batches):
+    """Yields the /wind JSON document a batch at a time as rows arrive from
+    the cursor. jsonify() would need the whole list up front, and it also
+    pretty-prints anything that isn't flagged as XHR."""
+    yield b'{"station":' + orjson.dumps(station) + b',"winddata":['
+    separator = b''
+    for rows in batches:
+        # encode the batch as a list and strip the brackets
+        yield separator + orjson.dumps(rows)[1:-1]
+        separator = b','
+    yield b']}'
+
+def parse_iso_time(s):
+    """Parses an ISO 8601 timestamp, such as the browser's Date.toISOString(),
+    into a naive UTC datetime to match the obs table"""
+    dt = datetime.fromisoformat(s)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
 
 @app.route(wind_url)
 def wind_data_as_json():
     station = request.args.get('stn', default_station)
-    start_time = request.args.get('from', datetime.utcnow()-timedelta(0,3600*24),
-                    type=lambda x : datetime.strptime(x, iso_format))
-    end_time = request.args.get('to', datetime.utcnow(),
-                    type=lambda x : datetime.strptime(x, iso_format))
-    winddatagen = query_wind_data(station, start_time, end_time)
-    # This is a kludge to make the data jasonifiable, since it contains
-    # datetime and Decimal classes
-    jsonfriendly = [(epoch_time(x[0]), safe_int(x[1]), safe_int(x[2]), safe_int(x[3])) 
-                    for x in winddatagen]
-    return jsonify(station=station, winddata=jsonfriendly)
+    now = utc_now()
+    start_time = request.args.get('from', now-timedelta(0,3600*24),
+                    type=parse_iso_time)
+    end_time = request.args.get('to', now, type=parse_iso_time)
+    # optional aggregation interval in minutes; buckets are aligned to the
+    # hour so values that divide 60 give evenly sized buckets
+    bucket = min(max(request.args.get('bucket', 0, int), 0), max_bucket_minutes)
+
+    # turn away requests that can't match anything before touching the
+    # database, and keep absurdly long ranges to the most recent week
+    if not station_re.fullmatch(station):
+        abort(400)
+    if end_time <= start_time:
+        return app.response_class(b''.join(generate_wind_json(station, [])),
+                                  mimetype='application/json')
+    if end_time - start_time > max_wind_span:
+        start_time = end_time - max_wind_span
+
+    if end_time - start_time > wind_cache_max_span:
+        # long ranges are streamed straight from the cursor, uncached
+        batches = query_wind_data(station, start_time, end_time, bucket)
+        return app.response_class(
+            stream_with_context(generate_wind_json(station, batches)),
+            mimetype='application/json')
+
+    if wind_cache_ttl <= 0:
+        # WIND_CACHE_TTL=0 turns the cache off: query the exact range
+        rows = fetch_wind_data(station, start_time, end_time, bucket)
+    else:
+        # Short ranges are what the pages poll for, and many viewers ask for
+        # nearly the same "last few hours". Snapping both ends to the cache
+        # interval lets those requests share one query.
+        key = (station, quantize_time(start_time), quantize_time(end_time), bucket)
+        rows = get_cached_wind_data(key)
+        if rows is None:
+            rows = fetch_wind_data(*key)
+            set_cached_wind_data(key, rows)
+        if not bucket:
+            # The snapped range can start a little early. Drop what came
+            # before the requested start, or the page's "since my last point"
+            # polls would get that point again.
+            first = bisect.bisect_left(rows, (start_time - epoch).total_seconds(),
+                                       key=lambda row: row[0])
+            rows = rows[first:]
+    # The scraper only appends, so the row count, the first time and the
+    # last row (whose bucket may still be filling) identify the result.
+    # A poll that already has it gets a 304 without any encoding.
+    etag = hashlib.md5(repr((station, len(rows), rows[:1], rows[-1:])).encode()).hexdigest()
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(b''.join(generate_wind_json(station, [rows])),
+                                      mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = wind_max_age
+    return response
+
+page_cache = {}
+page_cache_lock = threading.Lock()
+
+def render_page(template, max_age, **context):
+    """Renders a page template, reusing the HTML from an earlier request with
+    the same arguments, and lets browsers and proxies keep it for max_age
+    seconds. The pages only depend on their arguments and the script root
+    their links are built on; the data itself is fetched from /wind by the
+    browser."""
+    key = (template.name, request.script_root, repr(sorted(context.items())))
+    with page_cache_lock:
+        html = page_cache.get(key)
+    if html is None:
+        html = render_template(template, **context)
+        with page_cache_lock:
+            if key not in page_cache and len(page_cache) >= page_cache_size:
+                # drop the oldest entry; dicts keep insertion order
+                del page_cache[next(iter(page_cache))]
+            page_cache[key] = html
+    response = app.response_class(html, mimetype='text/html')
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
 
 @app.route('/')
 def hello():
     station = request.args.get('stn', default_station)
     minutes = request.args.get('minutes', 0, int)
     hours = request.args.get('hours', 3 if minutes == 0 else 0, int)
-    return render_template(
-        current_template, 
+    return render_page(
+        current_template, page_max_age,
         wind=wind_url,
         station=default_station,
         hours=hours,
@@ -135,13 +394,19 @@ def day(date=None):
     if date:
         start_date = datetime.strptime(date, '%Y-%m-%d')
         end_date = start_date + timedelta(1)
-        return render_template(day_template, 
+        # a day that has ended in every time zone won't get any new data
+        if end_date + timedelta(1) < utc_now():
+            max_age = past_day_max_age
+        else:
+            max_age = page_max_age
+        return render_page(day_template, max_age,
             wind=wind_url,
             station=default_station,
             start_time=[start_date.year, start_date.month-1, start_date.day],
             end_time=[end_date.year, end_date.month-1, end_date.day])
     else:
-        return render_template(day_template, wind=wind_url, station=default_station)
+        return render_page(day_template, page_max_age,
+            wind=wind_url, station=default_station)
 
 
 if __name__ == '__main__':